@@ -1,15 +1,67 @@
 """
 Synthetic data generation for information thermodynamics aging framework.
 """
+from dataclasses import dataclass
+
 import pandas as pd
 import numpy as np
 from .aging_model import InformationThermodynamicsModel
 
+# Scenario names indexed by AgingDataset.scenario_id
+SCENARIOS = ('baseline', 'intervention')
+
+# The scenario labels as a pandas array (with the dtype pandas infers for
+# strings), so label columns are a take() rather than per-element conversion
+_SCENARIO_LABELS = pd.Series(SCENARIOS).array
+
+@dataclass(eq=False)
+class AgingDataset:
+    """
+    Synthetic aging data as aligned column arrays, one entry per sample.
+    
+    Column names match the DataFrame returned by generate_synthetic_data;
+    the scenario is stored as an int8 index into SCENARIOS. Datasets compare
+    by identity (a field-wise == would compare arrays); compare columns with
+    np.array_equal or to_dataframe() instead.
+    """
+    __slots__ = ('age', 'information_fidelity', 'error_correction',
+                 'molecular_damage', 'entropy_production', 'scenario_id')
+    
+    age: np.ndarray
+    information_fidelity: np.ndarray
+    error_correction: np.ndarray
+    molecular_damage: np.ndarray
+    entropy_production: np.ndarray
+    scenario_id: np.ndarray
+    
+    def __len__(self):
+        return len(self.age)
+    
+    def to_dataframe(self, copy=True):
+        """
+        Convert to a pandas DataFrame. Both the int8 'scenario_id' (used for
+        filtering) and the string 'scenario' (used for labels) are included.
+        
+        With copy=False the frame adopts the column arrays without copying,
+        so it shares memory with this dataset. Columns appear in field order.
+        """
+        return pd.DataFrame({
+            'age': self.age,
+            'information_fidelity': self.information_fidelity,
+            'error_correction': self.error_correction,
+            'molecular_damage': self.molecular_damage,
+            'entropy_production': self.entropy_production,
+            'scenario': _SCENARIO_LABELS.take(self.scenario_id),
+            'scenario_id': self.scenario_id
+        }, copy=copy)
+
 class AgingDataGenerator:
     """
     Generate synthetic aging data based on the information thermodynamics model.
     """
     
+    __slots__ = ('model', 'noise_level', 'random_seed', 'rng')
+    
     def __init__(self, model_params=None, noise_level=0.05, random_seed=42):
         """
         Initialize data generator.
@@ -22,68 +74,196 @@ class AgingDataGenerator:
         self.model = InformationThermodynamicsModel(model_params)
         self.noise_level = noise_level
         self.random_seed = random_seed
-        np.random.seed(random_seed)
+        self.rng = np.random.default_rng(random_seed)
     
-    def generate_synthetic_data(self, include_intervention=False):
+    def generate_synthetic_data(self, include_intervention=False, return_ndarray=False):
         """
         Generate comprehensive synthetic aging dataset.
         
         Parameters:
         - include_intervention: bool, whether to include intervention scenario
+        - return_ndarray: bool, return an AgingDataset of column arrays instead
+          of a DataFrame
         
         Returns:
-        - pandas DataFrame with synthetic aging data
+        - pandas DataFrame (or AgingDataset) with synthetic aging data
         """
-        # Generate baseline aging data
-        baseline = self.model.simulate()
-        
-        # Add noise to simulate biological variability
-        noisy_I = self._add_noise(baseline['information_fidelity'], self.noise_level)
-        noisy_E = self._add_noise(baseline['error_correction'], self.noise_level)
-        noisy_D = self._add_noise(baseline['damage'], self.noise_level)
-        noisy_S = self._add_noise(baseline['entropy_production'], self.noise_level * 0.5)
-        
-        # Create baseline dataframe
-        df_baseline = pd.DataFrame({
-            'age': baseline['time'],
-            'information_fidelity': noisy_I,
-            'error_correction': noisy_E,
-            'molecular_damage': noisy_D,
-            'entropy_production': noisy_S,
-            'scenario': 'baseline'
-        })
-        
+        # Generate baseline aging data, plus the intervention run if requested
+        trajectories = [self.model.simulate()]
         if include_intervention:
-            # Generate intervention data
-            intervention = self.model.simulate_intervention()
-            noisy_I_int = self._add_noise(intervention['information_fidelity'], self.noise_level)
-            noisy_E_int = self._add_noise(intervention['error_correction'], self.noise_level)
-            noisy_D_int = self._add_noise(intervention['damage'], self.noise_level)
-            noisy_S_int = self._add_noise(intervention['entropy_production'], self.noise_level * 0.5)
-            
-            df_intervention = pd.DataFrame({
-                'age': intervention['time'],
-                'information_fidelity': noisy_I_int,
-                'error_correction': noisy_E_int,
-                'molecular_damage': noisy_D_int,
-                'entropy_production': noisy_S_int,
-                'scenario': 'intervention'
-            })
+            trajectories.append(self.model.simulate_intervention())
+        
+        # Preallocate the combined columns. The ODEs are solved in float64, but
+        # the noisy samples are stored as float32, which is ample for
+        # validation and plotting and halves the memory traffic downstream
+        n_total = sum(len(trajectory['time']) for trajectory in trajectories)
+        dataset = AgingDataset(
+            age=np.empty(n_total, dtype=np.float32),
+            information_fidelity=np.empty(n_total, dtype=np.float32),
+            error_correction=np.empty(n_total, dtype=np.float32),
+            molecular_damage=np.empty(n_total, dtype=np.float32),
+            entropy_production=np.empty(n_total, dtype=np.float32),
+            scenario_id=np.empty(n_total, dtype=np.int8)
+        )
+        
+        # (dataset column, trajectory key, noise level relative to noise_level)
+        channels = (
+            ('information_fidelity', 'information_fidelity', 1.0),
+            ('error_correction', 'error_correction', 1.0),
+            ('molecular_damage', 'damage', 1.0),
+            ('entropy_production', 'entropy_production', 0.5)
+        )
+        
+        start = 0
+        for scenario_id, trajectory in enumerate(trajectories):
+            rows = slice(start, start + len(trajectory['time']))
+            start = rows.stop
+            dataset.age[rows] = trajectory['time']
+            dataset.scenario_id[rows] = scenario_id
             
-            # Combine datasets
-            df = pd.concat([df_baseline, df_intervention], ignore_index=True)
+            # Add noise to simulate biological variability: one bulk draw per
+            # scenario, so earlier scenarios' noise does not depend on which
+            # scenarios follow. Each row becomes a noisy column in place
+            noise = self.rng.standard_normal((len(channels), rows.stop - rows.start),
+                                             dtype=np.float32)
+            for block, (column, key, relative_level) in zip(noise, channels):
+                getattr(dataset, column)[rows] = self._scale_noise(
+                    trajectory[key], self.noise_level * relative_level, block)
+        
+        if return_ndarray:
+            return dataset
+        # The dataset is private here, so the frame can take its arrays as-is
+        return dataset.to_dataframe(copy=False)
+    
+    def generate_ensemble_data(self, param_grid):
+        """
+        Generate synthetic baseline data for an ensemble of parameter sets.
+        
+        Parameters:
+        - param_grid: list of dicts, parameter overrides for each ensemble member
+        
+        Returns:
+        - pandas DataFrame in the same layout as generate_synthetic_data, with
+          an extra 'replicate' column indexing the parameter set
+        """
+        ensemble = self.model.simulate_ensemble(param_grid)
+        
+        # Each channel is an (N, T) array; noise is added row-wise in one call
+        # per channel, drawn straight into that channel's block of one float32
+        # buffer (float32 like generate_synthetic_data)
+        n, T = ensemble['damage'].shape
+        noisy = np.empty((4, n, T), dtype=np.float32)
+        channels = (
+            ('information_fidelity', 1.0),
+            ('error_correction', 1.0),
+            ('damage', 1.0),
+            ('entropy_production', 0.5)
+        )
+        for block, (key, relative_level) in zip(noisy, channels):
+            self._add_noise(ensemble[key], self.noise_level * relative_level, out=block)
+        
+        return pd.DataFrame({
+            'age': np.tile(ensemble['time'].astype(np.float32), n),
+            'information_fidelity': noisy[0].ravel(),
+            'error_correction': noisy[1].ravel(),
+            'molecular_damage': noisy[2].ravel(),
+            'entropy_production': noisy[3].ravel(),
+            'scenario': 'baseline',
+            'scenario_id': np.int8(SCENARIOS.index('baseline')),
+            'replicate': np.repeat(np.arange(n), T)
+        }, copy=False)
+    
+    def generate_replicates(self, n_replicates, param_grid=None, out=None):
+        """
+        Generate independent noisy replicates of the aging trajectories.
+        
+        Parameters:
+        - n_replicates: int, number of replicates
+        - param_grid: list of n_replicates dicts with parameter overrides for
+          each replicate (default: every replicate uses the model parameters)
+        - out: optional C-contiguous float32 array of shape (4, n_replicates, T)
+          to write the replicates into, so repeated Monte-Carlo batches can
+          reuse one buffer instead of allocating a new one per call
+        
+        Returns:
+        - dict with 'age' (length T) and float32 (n_replicates, T) arrays for
+          information_fidelity, error_correction, molecular_damage and
+          entropy_production, one trajectory per row (views of out if given)
+        """
+        if param_grid is None:
+            # Identical parameters give identical trajectories; integrate once
+            # and broadcast (read-only) instead of copying it per replicate
+            age, trajectories = self.model.simulate_replicates([{}])
+            T = trajectories.shape[-1]
+            signal = np.broadcast_to(trajectories.transpose(1, 0, 2), (4, n_replicates, T))
         else:
-            df = df_baseline
+            if len(param_grid) != n_replicates:
+                raise ValueError("param_grid must have one entry per replicate")
+            age, trajectories = self.model.simulate_replicates(param_grid)
+            signal = trajectories.transpose(1, 0, 2)
+        
+        # Channel-major (4, n_replicates, T) output, so every channel is one
+        # contiguous block and reductions across replicates read it linearly.
+        # Entropy production gets half the noise, as in generate_synthetic_data.
+        # Trajectories are integrated in float64; the noisy samples are float32
+        noise_levels = self.noise_level * np.array([1.0, 1.0, 1.0, 0.5])[:, None, None]
+        if out is None:
+            out = np.empty(signal.shape, dtype=np.float32)
+        elif out.shape != signal.shape or out.dtype != np.float32 or \
+                not out.flags.c_contiguous:
+            raise ValueError(f"out must be a C-contiguous float32 array of shape {signal.shape}")
         
-        return df
+        # Noise scales from the integrated (not broadcast) trajectories, so
+        # each distinct trajectory's std is reduced once
+        scale = noise_levels * trajectories.transpose(1, 0, 2).std(axis=-1, keepdims=True)
+        scale = np.broadcast_to(scale, (4, n_replicates, 1))
+        
+        # Draw replicate by replicate into one reused (4, T) block, so replicate
+        # r's noise does not depend on n_replicates and no (R, 4, T) noise
+        # array is allocated on top of out
+        scratch = np.empty((4, signal.shape[-1]), dtype=np.float32)
+        for r in range(n_replicates):
+            self.rng.standard_normal(dtype=np.float32, out=scratch)
+            out[:, r] = self._scale_noise(signal[:, r], noise_levels, scratch,
+                                          scale=scale[:, r])
+        return {
+            'age': age,
+            'information_fidelity': out[0],
+            'error_correction': out[1],
+            'molecular_damage': out[2],
+            'entropy_production': out[3]
+        }
     
-    def _add_noise(self, signal, noise_level):
-        """Add Gaussian noise to signal."""
-        noise = np.random.normal(0, noise_level * np.std(signal), len(signal))
-        noisy_signal = signal + noise
+    def _add_noise(self, signal, noise_level, out=None):
+        """
+        Add Gaussian noise to signal.
+        
+        For 2-D (or higher) input every row along the last axis is treated as
+        its own signal, with noise scaled by that row's standard deviation.
+        If out is given (a contiguous float32 or float64 array shaped like
+        signal, not signal itself), the result is written into it instead of
+        a new array, with the normals drawn at out's precision.
+        """
+        # Draw into the destination, then scale, add and clip in place
+        if out is None:
+            noise = self.rng.standard_normal(signal.shape)
+        else:
+            noise = self.rng.standard_normal(dtype=out.dtype, out=out)
+        return self._scale_noise(signal, noise_level, noise)
+    
+    def _scale_noise(self, signal, noise_level, noise, scale=None):
+        """
+        Turn standard normal draws into the noisy signal, in place in noise.
+        A precomputed scale (noise_level times the signal's std along the
+        last axis) skips recomputing the std.
+        """
+        if scale is None:
+            scale = noise_level * signal.std(axis=-1, keepdims=signal.ndim > 1)
+        noise *= scale
+        noise += signal
         # Ensure non-negative values for physical quantities
-        noisy_signal = np.maximum(noisy_signal, 0)
-        return noisy_signal
+        np.maximum(noise, 0, out=noise)
+        return noise
     
     def save_data(self, filename, include_intervention=False):
         """Save synthetic data to CSV file."""
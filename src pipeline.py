@@ -0,0 +1,50 @@
+"""
+Combined data generation and validation for the information thermodynamics aging framework.
+"""
+from .data_generator import AgingDataGenerator
+from .validation import AgingValidation
+
+class AgingPipeline:
+    """
+    Generate synthetic aging data and validate it in one pass.
+    
+    Equivalent to generate_synthetic_data followed by run_full_validation,
+    but the validation reads the generator's column buffers directly: each
+    scenario is a contiguous, age-ordered block of the AgingDataset, so it is
+    split into views without converting, sorting or copying any column, and
+    a DataFrame is only built for the caller at the end.
+    """
+    
+    __slots__ = ('generator', 'validator')
+    
+    def __init__(self, generator=None, validator=None):
+        """
+        Initialize the pipeline.
+        
+        Parameters:
+        - generator: AgingDataGenerator (default: AgingDataGenerator())
+        - validator: AgingValidation (default: AgingValidation())
+        """
+        self.generator = generator if generator is not None else AgingDataGenerator()
+        self.validator = validator if validator is not None else AgingValidation()
+    
+    def run(self, include_intervention=False, return_ndarray=False):
+        """
+        Generate a synthetic dataset and run the full validation suite on it.
+        
+        Parameters:
+        - include_intervention: bool, whether to include intervention scenario
+        - return_ndarray: bool, return the AgingDataset instead of a DataFrame
+        
+        Returns:
+        - (data, results): the synthetic data, as from generate_synthetic_data,
+          and the dict from run_full_validation
+        """
+        dataset = self.generator.generate_synthetic_data(include_intervention,
+                                                         return_ndarray=True)
+        results = self.validator.run_full_validation(
+            self.validator.group_by_scenario(dataset))
+        
+        if return_ndarray:
+            return dataset, results
+        return dataset.to_dataframe(copy=False), results
@@ -1,18 +1,62 @@
 """
 Validation functions for the information thermodynamics aging framework.
 """
+import hashlib
+from collections import OrderedDict
+
 import numpy as np
 import pandas as pd
 from scipy import stats
-from sklearn.linear_model import LinearRegression
-from statsmodels.tsa.stattools import grangercausalitytests
 from .aging_model import InformationThermodynamicsModel
+from .data_generator import SCENARIOS, AgingDataset
+
+# Columns the validation tests read from the aging data
+VALIDATION_COLUMNS = ('age', 'information_fidelity', 'molecular_damage',
+                      'entropy_production')
+
+# Columns temporal_precedence_test depends on, used to fingerprint its input
+PRECEDENCE_COLUMNS = ('age', 'information_fidelity', 'molecular_damage')
+
+# Recent temporal_precedence_test results, keyed on input fingerprint
+_PRECEDENCE_CACHE_SIZE = 16
+_precedence_cache = OrderedDict()
+
+def clear_cache():
+    """Drop all memoized temporal_precedence_test results."""
+    _precedence_cache.clear()
+
+def _fingerprint(arrays, codes, names):
+    """
+    Content hash of the data temporal_precedence_test reads.
+    
+    Parameters:
+    - arrays, codes, names: column arrays, scenario codes and scenario names,
+      as returned by AgingValidation._column_view
+    
+    Returns:
+    - bytes digest; equal data gives equal digests
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    
+    def update(name, values):
+        values = np.ascontiguousarray(values)
+        digest.update(f"{name}:{values.dtype.str}:{values.shape};".encode())
+        digest.update(values.view(np.uint8))
+    
+    for col in PRECEDENCE_COLUMNS:
+        if col in arrays:
+            update(col, arrays[col])
+    update('codes', codes)
+    digest.update('\x1f'.join(map(str, names)).encode())
+    return digest.digest()
 
 class AgingValidation:
     """
     Validation suite for testing predictions of the information thermodynamics framework.
     """
     
+    __slots__ = ('critical_thresholds',)
+    
     def __init__(self, critical_thresholds=None):
         """
         Initialize validation with critical thresholds.
@@ -32,28 +76,54 @@ class AgingValidation:
         """
         Test if information loss precedes molecular damage accumulation.
         
+        DataFrame and AgingDataset results are memoized on a content
+        fingerprint of the input and the thresholds, so repeated calls on the
+        same data skip splitting and sorting it; call clear_cache() to drop
+        them. Already grouped input is cheaper to scan than to hash and is
+        never cached.
+        
         Parameters:
-        - data: pandas DataFrame with aging data
+        - data: pandas DataFrame or AgingDataset with aging data, or the output
+          of group_by_scenario
         - scenario: str, which scenario to analyze
         
         Returns:
         - dict with test results
         """
-        # Filter data by scenario
-        df = data[data['scenario'] == scenario].copy()
-        df = df.sort_values('age')
+        if isinstance(data, dict):
+            return self._temporal_precedence_test(data, scenario)
+        
+        # Columns are read once and shared by the fingerprint and the split
+        view = self._column_view(data)
+        key = (_fingerprint(*view), scenario,
+               self.critical_thresholds['information'],
+               self.critical_thresholds['damage'])
+        if key in _precedence_cache:
+            _precedence_cache.move_to_end(key)
+            return dict(_precedence_cache[key])
+        
+        results = self._temporal_precedence_test(self._group_view(*view), scenario)
+        _precedence_cache[key] = results
+        if len(_precedence_cache) > _PRECEDENCE_CACHE_SIZE:
+            _precedence_cache.popitem(last=False)
+        return dict(results)
+    
+    def _temporal_precedence_test(self, data, scenario):
+        """Uncached temporal_precedence_test."""
+        # Select the scenario's age-sorted arrays
+        df = self._scenario_arrays(data, scenario)
         
         # Find crossing points
         info_crossing = self._find_crossing_point(
-            df['age'].values, 
-            df['information_fidelity'].values, 
+            df['age'], 
+            df['information_fidelity'], 
             self.critical_thresholds['information'], 
             direction='below'
         )
         
         damage_crossing = self._find_crossing_point(
-            df['age'].values, 
-            df['molecular_damage'].values, 
+            df['age'], 
+            df['molecular_damage'], 
             self.critical_thresholds['damage'], 
             direction='above'
         )
@@ -81,19 +151,19 @@ class AgingValidation:
         Test Granger causality between information and damage.
         
         Parameters:
-        - data: pandas DataFrame with aging data
+        - data: pandas DataFrame or AgingDataset with aging data, or the output
+          of group_by_scenario
         - scenario: str, which scenario to analyze
         - max_lag: int, maximum lag for Granger test
         
         Returns:
         - dict with causality results
         """
-        df = data[data['scenario'] == scenario].copy()
-        df = df.sort_values('age')
+        df = self._scenario_arrays(data, scenario)
         
         # Prepare time series data
-        info_series = df['information_fidelity'].values
-        damage_series = df['molecular_damage'].values
+        info_series = df['information_fidelity']
+        damage_series = df['molecular_damage']
         
         # Test if information Granger-causes damage
         info_to_damage = self._granger_causality_test(
@@ -102,12 +172,9 @@ class AgingValidation:
             max_lag=max_lag
         )
         
-        # Test if damage Granger-causes itself (autocorrelation baseline)
-        damage_to_damage = self._granger_causality_test(
-            cause_series=damage_series,
-            effect_series=damage_series,
-            max_lag=max_lag
-        )
+        # Autocorrelation baseline: a series trivially "Granger-causes" itself,
+        # so use the closed-form lag-1 R-squared, corr(D[t-1], D[t])^2
+        r2_damage_autocorrelation = self._calculate_r2_prediction(damage_series, damage_series, 1)
         
         # Calculate R-squared values for comparison
         r2_info_cause = self._calculate_r2_prediction(info_series, damage_series, max_lag)
@@ -115,9 +182,9 @@ class AgingValidation:
         
         return {
             'info_granger_causes_damage': info_to_damage['significant'],
-            'damage_autocorrelation': damage_to_damage['significant'],
+            'damage_autocorrelation': r2_damage_autocorrelation > 0.5,
             'info_to_damage_p_value': info_to_damage['p_value'],
-            'damage_to_damage_p_value': damage_to_damage['p_value'],
+            'damage_autocorrelation_r2': r2_damage_autocorrelation,
             'r2_info_prediction': r2_info_cause,
             'r2_damage_prediction': r2_damage_cause,
             'max_lag': max_lag
@@ -128,42 +195,40 @@ class AgingValidation:
         Analyze the response to information restoration intervention.
         
         Parameters:
-        - data: pandas DataFrame with both baseline and intervention scenarios
+        - data: pandas DataFrame or AgingDataset with both baseline and
+          intervention scenarios, or the output of group_by_scenario
         
         Returns:
         - dict with intervention analysis results
         """
+        baseline = self._scenario_arrays(data, 'baseline')
+        intervention = self._scenario_arrays(data, 'intervention')
+        
         # Get intervention age from data
-        intervention_ages = data[data['scenario'] == 'intervention']['age']
-        if len(intervention_ages) == 0:
+        if len(intervention['age']) == 0:
             return {'intervention_performed': False}
         
-        # Find intervention time point (minimum age where intervention starts)
-        intervention_age = intervention_ages.min()
+        # Find intervention time point (minimum age where intervention starts);
+        # arrays are sorted by age so this is the first entry
+        intervention_age = intervention['age'][0]
         
         # Get data points just before and after intervention
-        baseline_at_intervention = data[
-            (data['scenario'] == 'baseline') & 
-            (np.abs(data['age'] - intervention_age) < 1.0)
-        ]
-        
-        intervention_at_intervention = data[
-            (data['scenario'] == 'intervention') & 
-            (np.abs(data['age'] - intervention_age) < 1.0)
-        ]
+        baseline_window = self._age_window(baseline['age'], intervention_age, 1.0)
+        intervention_window = self._age_window(intervention['age'], intervention_age, 1.0)
         
-        if len(baseline_at_intervention) == 0 or len(intervention_at_intervention) == 0:
+        if baseline_window.start == baseline_window.stop or \
+                intervention_window.start == intervention_window.stop:
             return {'intervention_performed': False}
         
-        # Calculate changes
-        baseline_I = baseline_at_intervention['information_fidelity'].mean()
-        intervention_I = intervention_at_intervention['information_fidelity'].mean()
+        # Calculate changes (slices are views, so no column is copied)
+        baseline_I = baseline['information_fidelity'][baseline_window].mean()
+        intervention_I = intervention['information_fidelity'][intervention_window].mean()
         
-        baseline_S = baseline_at_intervention['entropy_production'].mean()
-        intervention_S = intervention_at_intervention['entropy_production'].mean()
+        baseline_S = baseline['entropy_production'][baseline_window].mean()
+        intervention_S = intervention['entropy_production'][intervention_window].mean()
         
-        baseline_D = baseline_at_intervention['molecular_damage'].mean()
-        intervention_D = intervention_at_intervention['molecular_damage'].mean()
+        baseline_D = baseline['molecular_damage'][baseline_window].mean()
+        intervention_D = intervention['molecular_damage'][intervention_window].mean()
         
         # Calculate percentage changes
         I_change_pct = ((intervention_I - baseline_I) / baseline_I) * 100
@@ -184,71 +249,192 @@ class AgingValidation:
         Run complete validation suite.
         
         Parameters:
-        - data: pandas DataFrame with aging data
+        - data: pandas DataFrame or AgingDataset with aging data
         
         Returns:
         - dict with all validation results
         """
         results = {}
         
+        # Split by scenario once and share the arrays across all tests
+        groups = self.group_by_scenario(data)
+        
         # Temporal precedence
-        results['temporal_precedence'] = self.temporal_precedence_test(data)
+        results['temporal_precedence'] = self.temporal_precedence_test(groups)
         
         # Granger causality
-        results['granger_causality'] = self.granger_causality_test(data)
+        results['granger_causality'] = self.granger_causality_test(groups)
         
         # Intervention analysis (if intervention data exists)
-        if 'intervention' in data['scenario'].values:
-            results['intervention_response'] = self.intervention_response_analysis(data)
+        if 'intervention' in groups:
+            results['intervention_response'] = self.intervention_response_analysis(groups)
         else:
             results['intervention_response'] = {'intervention_performed': False}
         
         return results
     
+    def group_by_scenario(self, data):
+        """
+        Split aging data into per-scenario arrays, sorted by age.
+        
+        Parameters:
+        - data: pandas DataFrame or AgingDataset with aging data
+        
+        Returns:
+        - dict mapping scenario name to a dict of column name -> ndarray;
+          these may be views of the input's columns, so treat them as
+          read-only
+        """
+        if isinstance(data, dict):
+            return data
+        return self._group_view(*self._column_view(data))
+    
+    def _group_view(self, arrays, codes, names):
+        """Split a _column_view into per-scenario, age-ordered arrays."""
+        groups = {}
+        for code, name in enumerate(names):
+            rows = np.flatnonzero(codes == code)
+            if len(rows) == 0:
+                continue
+            rows = self._age_order(arrays['age'], rows)
+            groups[name] = {col: values[rows] for col, values in arrays.items()}
+        return groups
+    
+    def _column_view(self, data):
+        """
+        Read the validation columns of a DataFrame or AgingDataset once.
+        
+        Returns:
+        - (arrays, codes, names): dict of column name -> ndarray, the integer
+          scenario code of every row, and the scenario name for each code
+        """
+        if isinstance(data, AgingDataset):
+            arrays = {col: getattr(data, col) for col in VALIDATION_COLUMNS}
+            return arrays, data.scenario_id, SCENARIOS
+        
+        columns = [col for col in VALIDATION_COLUMNS if col in data.columns]
+        
+        # Convert each column once and gather every scenario's rows from the
+        # arrays, rather than going through pandas groupby. The integer
+        # scenario code is much cheaper to compare than the string labels
+        arrays = {col: data[col].to_numpy() for col in columns}
+        if 'scenario_id' in data.columns:
+            codes = data['scenario_id'].to_numpy()
+            names = SCENARIOS
+        else:
+            # Hash-based codes for the labels, in order of first appearance;
+            # missing labels get -1 and are skipped, as groupby would
+            codes, names = pd.factorize(data['scenario'])
+        return arrays, codes, names
+    
+    def _age_order(self, ages, rows):
+        """
+        Selector for the given rows in age order.
+        
+        Generated data is already sorted by age within each scenario, so
+        contiguous rows in non-decreasing age order give a slice (columns are
+        then views, not copies); anything else is sorted once with a stable
+        argsort, which the slice matches exactly when no sort is needed.
+        """
+        if len(rows) and rows[-1] - rows[0] + 1 == len(rows):
+            block = slice(rows[0], rows[-1] + 1)
+            if np.all(ages[block][1:] >= ages[block][:-1]):
+                return block
+        return rows[np.argsort(ages[rows], kind='stable')]
+    
+    def _scenario_arrays(self, data, scenario):
+        """Age-sorted column arrays for one scenario (empty if absent)."""
+        groups = self.group_by_scenario(data)
+        if scenario in groups:
+            return groups[scenario]
+        return {col: np.array([]) for col in VALIDATION_COLUMNS}
+    
+    def _age_window(self, ages, center, half_width):
+        """Slice of sorted ages strictly within half_width of center."""
+        start = np.searchsorted(ages, center - half_width, side='right')
+        stop = np.searchsorted(ages, center + half_width, side='left')
+        return slice(start, max(start, stop))
+    
     def _find_crossing_point(self, x, y, threshold, direction='above'):
         """Find the x-value where y crosses threshold."""
-        if direction == 'above':
-            mask = y >= threshold
-        else:
-            mask = y <= threshold
+        # Signed distance past the threshold, flipped for 'below', so both
+        # directions look for the first point with diff >= 0
+        sign = 1.0 if direction == 'above' else -1.0
+        diff = sign * (y - threshold)
+        crossed = diff >= 0
         
-        if not np.any(mask):
+        if len(diff) == 0:
             return None
         
-        crossing_idx = np.where(mask)[0][0]
+        # argmax stops at the first True; all-False means no crossing
+        crossing_idx = int(np.argmax(crossed))
+        if not crossed[crossing_idx]:
+            return None
         if crossing_idx == 0:
             return x[0]
         
-        # Linear interpolation for more precise crossing point
+        # Linear interpolation for more precise crossing point; d1 < 0 <= d2
         x1, x2 = x[crossing_idx-1], x[crossing_idx]
-        y1, y2 = y[crossing_idx-1], y[crossing_idx]
-        
-        if y2 == y1:
-            return x2
-        
-        t = (threshold - y1) / (y2 - y1)
-        return x1 + t * (x2 - x1)
+        d1, d2 = diff[crossing_idx-1], diff[crossing_idx]
+        return x1 - d1 * (x2 - x1) / (d2 - d1)
     
     def _granger_causality_test(self, cause_series, effect_series, max_lag=3):
-        """Perform Granger causality test."""
+        """
+        Perform Granger causality test.
+        
+        For each lag p, an OLS fit of effect on its own p lags (restricted)
+        is compared with one that also includes p lags of cause (full) via
+        the SSR-based F-test, as in statsmodels' grangercausalitytests. Both
+        fits come from one QR factorisation of the full design matrix; cause
+        lags that add no rank (e.g. a constant cause) give p = 1.
+        """
         try:
-            # Create DataFrame for statsmodels
-            data = pd.DataFrame({
-                'effect': effect_series,
-                'cause': cause_series
-            })
+            data = np.column_stack([effect_series, cause_series]).astype(float)
             
             # Remove any NaN values
-            data = data.dropna()
+            data = data[~np.isnan(data).any(axis=1)]
             
             if len(data) < max_lag * 2:
                 return {'significant': False, 'p_value': 1.0}
             
-            # Perform Granger causality test
-            result = grangercausalitytests(data[['effect', 'cause']], max_lag, verbose=False)
+            p_values = []
+            for lag in range(1, max_lag + 1):
+                # Row t of each window holds series[t], ..., series[t + lag]
+                windows = np.lib.stride_tricks.sliding_window_view(data, lag + 1, axis=0)
+                target = windows[:, 0, -1]
+                effect_lags = windows[:, 0, :-1]
+                cause_lags = windows[:, 1, :-1]
+                ones = np.ones((len(target), 1))
+                
+                # The restricted design is a column prefix of the full one, so a
+                # single QR gives both fits: projecting onto the trailing Q
+                # columns is exactly what the cause lags add
+                X_full = np.hstack([ones, effect_lags, cause_lags])
+                Q, R = np.linalg.qr(X_full)
+                
+                # A column that depends on earlier ones has a ~0 diagonal in R
+                # but still gets an arbitrary orthonormal Q column; keep only
+                # the independent directions, as lstsq would
+                diag = np.abs(np.diag(R))
+                independent = diag > diag.max() * max(X_full.shape) * np.finfo(float).eps
+                rank_restricted = np.count_nonzero(independent[:lag + 1])
+                rank_full = np.count_nonzero(independent)
+                df_num = rank_full - rank_restricted
+                dof = len(target) - rank_full
+                if df_num == 0 or dof <= 0:
+                    # The cause lags add nothing the effect lags do not span
+                    p_values.append(1.0)
+                    continue
+                
+                coef = Q[:, independent].T @ target
+                residuals = target - Q[:, independent] @ coef
+                rss_full = residuals @ residuals
+                rss_restricted = rss_full + coef[rank_restricted:] @ coef[rank_restricted:]
+                
+                f_stat = ((rss_restricted - rss_full) / df_num) / (rss_full / dof)
+                p_values.append(stats.f.sf(f_stat, df_num, dof))
             
             # Get p-value from the best lag (lowest p-value)
-            p_values = [result[lag][0]['ssr_ftest'][1] for lag in range(1, max_lag + 1)]
             min_p_value = min(p_values)
             
             return {
@@ -264,16 +450,16 @@ class AgingValidation:
         if len(predictor) <= lag or len(target) <= lag:
             return 0.0
         
-        X = predictor[:-lag].reshape(-1, 1)
+        x = predictor[:-lag]
         y = target[lag:]
         
-        if len(X) == 0 or len(y) == 0:
+        if len(x) == 0 or len(y) == 0:
             return 0.0
         
+        # With a single predictor the least-squares R-squared is corr(x, y)^2
         try:
-            model = LinearRegression()
-            model.fit(X, y)
-            r2 = model.score(X, y)
-            return max(0.0, r2)  # Ensure non-negative
-        except:
+            with np.errstate(invalid='ignore', divide='ignore'):
+                c = np.corrcoef(x, y)[0, 1]
+            return c * c if np.isfinite(c) else 0.0
+        except ValueError:
             return 0.0
\ No newline at end of file
@@ -8,6 +8,8 @@ import pandas as pd
 class AgingVisualization:
     """Visualization suite for aging framework results."""
     
+    __slots__ = ('figsize',)
+    
     def __init__(self, figsize=(12, 10)):
         self.figsize = figsize
     
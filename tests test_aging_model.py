@@ -1,15 +1,24 @@
 """
 Unit tests for the aging model.
 """
+import copy
 import unittest
+from unittest import mock
 import numpy as np
 import pandas as pd
+from src import aging_model
 from src.aging_model import InformationThermodynamicsModel
 from src.data_generator import AgingDataGenerator
-from src.validation import AgingValidation
+from src.validation import AgingValidation, clear_cache
+from src.pipeline import AgingPipeline
 
 class TestAgingModel(unittest.TestCase):
     
+    @classmethod
+    def setUpClass(cls):
+        """Generate the default synthetic dataset once for the tests that read it."""
+        cls.data = AgingDataGenerator().generate_synthetic_data()
+    
     def test_model_initialization(self):
         """Test model initialization with default parameters."""
         model = InformationThermodynamicsModel()
@@ -29,11 +38,109 @@ class TestAgingModel(unittest.TestCase):
         
         # Check that information fidelity decreases over time
         self.assertLess(results['information_fidelity'][-1], results['information_fidelity'][0])
+        
+        # Output times are the caller's own array, not the shared grid
+        time = results['time'].copy()
+        results['time'] += 1.0
+        np.testing.assert_array_equal(model.simulate(t_span=(0, 10))['time'], time)
+    
+    def test_jacobian(self):
+        """Test analytic Jacobian against finite differences."""
+        model = InformationThermodynamicsModel()
+        y = np.array([0.7, 0.8, 0.3])
+        eps = 1e-7
+        f0 = np.array(model.coupled_odes(0, y))
+        numeric = np.column_stack([
+            (np.array(model.coupled_odes(0, y + eps * np.eye(3)[i])) - f0) / eps
+            for i in range(3)
+        ])
+        np.testing.assert_allclose(model.jacobian(0, y), numeric, atol=1e-6)
+    
+    def test_simulate_ensemble(self):
+        """Test that an ensemble run matches individual simulations."""
+        model = InformationThermodynamicsModel()
+        grid = [{'alpha': 0.015}, {'alpha': 0.025, 'mu': 0.04}]
+        ensemble = model.simulate_ensemble(grid, t_span=(0, 10))
+        
+        self.assertEqual(ensemble['damage'].shape, (2, len(ensemble['time'])))
+        for i, overrides in enumerate(grid):
+            single = InformationThermodynamicsModel({**model.params, **overrides})
+            results = single.simulate(t_span=(0, 10))
+            np.testing.assert_allclose(ensemble['information_fidelity'][i],
+                                       results['information_fidelity'], rtol=1e-6)
+    
+    def test_simulate_replicates(self):
+        """Test that the compiled RK4 replicates match solve_ivp."""
+        model = InformationThermodynamicsModel()
+        grid = [{'alpha': 0.015}, {'nu': 0.03}]
+        age, out = model.simulate_replicates(grid, t_span=(0, 10))
+        
+        self.assertEqual(out.shape, (2, 4, len(age)))
+        for i, overrides in enumerate(grid):
+            single = InformationThermodynamicsModel({**model.params, **overrides})
+            results = single.simulate(t_span=(0, 10))
+            np.testing.assert_allclose(out[i, 2], results['damage'], rtol=1e-6)
+        
+        # Output times after t_span[0] still start from the initial state there
+        t_eval = np.linspace(50, 70, 521)
+        age, out = model.simulate_replicates([{}], t_eval=t_eval)
+        results = model.simulate(t_eval=t_eval, method='rk4')
+        np.testing.assert_array_equal(age, t_eval)
+        np.testing.assert_allclose(out[0, 2], results['damage'], rtol=1e-12)
+    
+    def test_integrate_replicates_fallback(self):
+        """Test the vectorized no-numba ensemble kernel against per-member RK4."""
+        # Run the kernel as plain Python, as it is when numba is missing
+        kernel = getattr(aging_model._rk4_trajectory, 'py_func',
+                         aging_model._rk4_trajectory)
+        n = aging_model._VECTORIZE_MIN_MODELS
+        t_eval = np.linspace(0, 5, 261)
+        params = np.tile(np.array(InformationThermodynamicsModel()._kernel_args()), (n, 1))
+        params[:, 0] *= np.linspace(0.5, 1.5, n)
+        y0 = np.tile([1.0, 1.0, 0.01], (n, 1))
+        
+        out = np.empty((n, 4, len(t_eval)))
+        with mock.patch.object(aging_model, '_rk4_trajectory', kernel):
+            aging_model._integrate_replicates_py(t_eval, y0, params, out, 4)
+        
+        for i in range(n):
+            expected = np.empty((4, len(t_eval)))
+            kernel(t_eval, y0[i], params[i], expected, 4)
+            np.testing.assert_allclose(out[i], expected, rtol=1e-12)
+    
+    def test_generate_replicates(self):
+        """Test that replicates come back as one (R, T) array per channel."""
+        generator = AgingDataGenerator()
+        replicates = generator.generate_replicates(3, [{}, {'alpha': 0.015}, {}])
+        
+        T = len(replicates['age'])
+        for col in ('information_fidelity', 'error_correction',
+                    'molecular_damage', 'entropy_production'):
+            self.assertEqual(replicates[col].shape, (3, T))
+            self.assertTrue(replicates[col].flags.c_contiguous)
+        
+        # Slower information decay keeps the replicate above the others
+        mean_I = replicates['information_fidelity'][:, -520:].mean(axis=1)
+        self.assertGreater(mean_I[1], max(mean_I[0], mean_I[2]))
+        
+        with self.assertRaises(ValueError):
+            generator.generate_replicates(2, [{}])
+        
+        # Each replicate's noise is independent of how many are drawn
+        fewer = AgingDataGenerator().generate_replicates(2, [{}, {'alpha': 0.015}])
+        np.testing.assert_array_equal(fewer['molecular_damage'],
+                                      replicates['molecular_damage'][:2])
+        
+        # A caller-provided buffer is filled in place and can be reused
+        buffer = np.empty((4, 2, T), dtype=np.float32)
+        replicates = generator.generate_replicates(2, out=buffer)
+        self.assertTrue(np.shares_memory(replicates['molecular_damage'], buffer))
+        with self.assertRaises(ValueError):
+            generator.generate_replicates(3, out=buffer)
     
     def test_data_generation(self):
         """Test synthetic data generation."""
-        generator = AgingDataGenerator()
-        data = generator.generate_synthetic_data()
+        data = self.data
         
         self.assertIsInstance(data, pd.DataFrame)
         self.assertGreater(len(data), 0)
@@ -41,17 +148,93 @@ class TestAgingModel(unittest.TestCase):
         self.assertIn('information_fidelity', data.columns)
         self.assertIn('molecular_damage', data.columns)
     
+    def test_baseline_independent_of_intervention(self):
+        """Test that adding the intervention scenario leaves baseline rows unchanged."""
+        data = AgingDataGenerator().generate_synthetic_data(include_intervention=True)
+        baseline = data[data['scenario'] == 'baseline']
+        
+        pd.testing.assert_frame_equal(baseline, self.data)
+    
+    def test_ndarray_dataset(self):
+        """Test that the array dataset validates like the DataFrame."""
+        dataset = AgingDataGenerator().generate_synthetic_data(
+            include_intervention=True, return_ndarray=True)
+        data = AgingDataGenerator().generate_synthetic_data(include_intervention=True)
+        
+        self.assertEqual(len(dataset), len(data))
+        pd.testing.assert_frame_equal(dataset.to_dataframe(), data)
+        
+        # Datasets compare by identity rather than raising on array fields
+        self.assertFalse(dataset == copy.deepcopy(dataset))
+        
+        validator = AgingValidation()
+        self.assertEqual(validator.temporal_precedence_test(dataset),
+                         validator.temporal_precedence_test(data))
+    
     def test_temporal_precedence(self):
         """Test temporal precedence validation."""
-        generator = AgingDataGenerator()
-        data = generator.generate_synthetic_data()
-        
         validator = AgingValidation()
-        results = validator.temporal_precedence_test(data)
+        results = validator.temporal_precedence_test(self.data)
         
         self.assertIn('temporal_precedence', results)
         self.assertIn('info_crossing_age', results)
         self.assertIn('damage_crossing_age', results)
+    
+    def test_temporal_precedence_cache(self):
+        """Test that cached precedence results track the data and thresholds."""
+        clear_cache()
+        validator = AgingValidation()
+        results = validator.temporal_precedence_test(self.data)
+        
+        # Repeat calls return equal results that callers can modify freely
+        results['temporal_precedence'] = None
+        self.assertEqual(validator.temporal_precedence_test(self.data.copy()),
+                         validator.temporal_precedence_test(self.data))
+        self.assertIsNotNone(validator.temporal_precedence_test(self.data)['temporal_precedence'])
+        
+        # Changed data or thresholds are not served from the cache
+        shifted = self.data.copy()
+        shifted['information_fidelity'] -= 0.05
+        self.assertLess(validator.temporal_precedence_test(shifted)['info_crossing_age'],
+                        validator.temporal_precedence_test(self.data)['info_crossing_age'])
+        strict = AgingValidation({'information': 0.7, 'damage': 0.45})
+        self.assertLess(strict.temporal_precedence_test(self.data)['info_crossing_age'],
+                        validator.temporal_precedence_test(self.data)['info_crossing_age'])
+        clear_cache()
+    
+    def test_granger_causality_p_values(self):
+        """Test Granger F-test p-values per lag on a fixed series."""
+        t = np.arange(40)
+        cause = np.sin(0.7 * t) + 0.3 * np.cos(2.3 * t)
+        effect = np.zeros(40)
+        for i in range(1, 40):
+            effect[i] = (0.4 * effect[i - 1] + 0.15 * cause[i - 1]
+                         + np.sin(3.1 * i) * np.cos(1.7 * i))
+    
+        # Reference values from statsmodels' grangercausalitytests (ssr_ftest);
+        # they fall with the lag, so max_lag=k returns the lag-k p-value
+        expected = {1: 0.1589384341490738,
+                    2: 2.0152600776078188e-07,
+                    3: 6.543523843419445e-20}
+        validator = AgingValidation()
+        for lag, p_value in expected.items():
+            result = validator._granger_causality_test(cause, effect, max_lag=lag)
+            self.assertAlmostEqual(result['p_value'] / p_value, 1.0, places=9)
+            self.assertEqual(result['significant'], p_value < 0.05)
+        
+        # A constant cause, or the effect itself, adds no rank to the design
+        for degenerate in (np.zeros(40), np.full(40, 2.5), effect):
+            result = validator._granger_causality_test(degenerate, effect, max_lag=3)
+            self.assertEqual(result['p_value'], 1.0)
+            self.assertFalse(result['significant'])
+    
+    def test_pipeline(self):
+        """Test that the fused pipeline matches generating then validating."""
+        data, results = AgingPipeline().run(include_intervention=True)
+        
+        expected = AgingDataGenerator().generate_synthetic_data(include_intervention=True)
+        pd.testing.assert_frame_equal(data, expected)
+        self.assertEqual(results, AgingValidation().run_full_validation(expected))
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file